@@ -4,18 +4,26 @@ from marjapussi.utils import Card, sorted_cards
 from marjapussi.action import Action, Talk
 from marjapussi.gamestate import GameState
 
-from tqdm import trange
+from collections import deque
+from functools import partial
+from multiprocessing import Pool
+from tqdm import tqdm
 import logging
+import numpy as np
+import random
 
 logging.basicConfig(format='%(levelname)s: %(message)s')
 
 
 class Agent:
     """Implements an agent able to play Marjapussi."""
-    def __init__(self, name: str, all_players: list[str], policy: Policy, start_cards: list[Card], log=False) -> None:
+    def __init__(self, name: str, all_players: list[str], policy: Policy, start_cards: list[Card], log=False,
+                 history: list[Action] = None) -> None:
+        """history: action log of the game shared by all agents instead of each agent keeping its own copy"""
         self.name = name
         self.all_players = all_players
-        self.state = GameState(name, all_players, start_cards)
+        self.state = GameState(name, all_players, start_cards, actions=history)
+        self._shared_history = history is not None
         self.policy = policy
         self.logger = logging.getLogger("single_agent_logger")
         self.log = log
@@ -24,6 +32,23 @@ class Agent:
         if log == "DEBUG":
             self.logger.setLevel(logging.DEBUG)
         self.logger.info(f"Created Agent: {self}")
+        # phases without an entry (PRMO) don't change the agents knowledge
+        self._observe_in_phase = {
+            'TRCK': self._observe_trck,
+            'PASS': self._observe_pass,
+            'PBCK': self._observe_pass,
+            'QUES': self._observe_ques,
+            'ANSW': self._observe_answ,
+            'ANSA': self._observe_ansa,
+            'PROV': self._observe_prov,
+        }
+
+    def reset(self, all_players: list[str], start_cards: list[Card], history: list[Action] = None) -> None:
+        """Prepares the agent for a new game with the same policy, e.g. after MarjaPussi.reset"""
+        self.all_players = all_players
+        self.state.reset(all_players, start_cards, actions=history)
+        self._shared_history = history is not None
+        self.logger.info(f"Reset Agent: {self}")
 
     def __str__(self):
         return f"<{self.name} Agent, {type(self.policy).__name__}>"
@@ -39,46 +64,52 @@ class Agent:
         """
         # simplify variable names for current context
         player_num = action.player_number
-        partner_num = (player_num + 2) % 4
         player_name = self.all_players[player_num]
         self.state.phase = action.phase
-        match action.phase:
-            case 'TRCK':  # do the action on the agents representation of the trick
-                card_played: Card = action.content
-                self.state.play_card(card_played, player_num)
-
-            case 'PASS' | 'PBCK':
-                card_pass = action.content
-                if action.phase == 'PASS':
-                    self.state.playing_party = [player_num, partner_num]
-                if self.state.player_num in self.state.playing_party:
-                    self.state.pass_card(card_pass, player_name, player_num, partner_num)
-
-            case 'QUES':
-                question: Talk = action.content
-                self.state.ask_question(question.pronoun, player_name)
-
-            case 'ANSW':
-                answer: Talk = action.content
-                self.state.answer_question(answer, player_name)
+        observe_in_phase = self._observe_in_phase.get(action.phase)
+        if observe_in_phase:
+            observe_in_phase(action, player_num, player_name)
 
-            case 'ANSA':
-                ansage: Talk = action.content
-                self.state.announce_ansage(ansage, player_name)
-
-            case 'PROV':
-                self.state.provoke(action)
+        # a shared history (the games log) already holds the action, so the policy sees it in state.actions either way
+        if not self._shared_history:
+            self.state.actions.append(action)
 
         # let the policy observe the action as well
         self.policy.observe_action(self.state, action)
 
-        self.state.actions.append(action)
-
         self.logger.debug(f"{self} observed {action}.")
 
         if self.log == 'DEBUG':
             self._print_state()
 
+    def _observe_trck(self, action: Action, player_num: int, player_name: str) -> None:
+        # do the action on the agents representation of the trick
+        card_played: Card = action.content
+        self.state.play_card(card_played, player_num)
+
+    def _observe_pass(self, action: Action, player_num: int, player_name: str) -> None:
+        partner_num = (player_num + 2) % 4
+        card_pass = action.content
+        if action.phase == 'PASS':
+            self.state.playing_party = [player_num, partner_num]
+        if self.state.player_num in self.state.playing_party:
+            self.state.pass_card(card_pass, player_name, player_num, partner_num)
+
+    def _observe_ques(self, action: Action, player_num: int, player_name: str) -> None:
+        question: Talk = action.content
+        self.state.ask_question(question.pronoun, player_name)
+
+    def _observe_answ(self, action: Action, player_num: int, player_name: str) -> None:
+        answer: Talk = action.content
+        self.state.answer_question(answer, player_name)
+
+    def _observe_ansa(self, action: Action, player_num: int, player_name: str) -> None:
+        ansage: Talk = action.content
+        self.state.announce_ansage(ansage, player_name)
+
+    def _observe_prov(self, action: Action, player_num: int, player_name: str) -> None:
+        self.state.provoke(action)
+
     def _print_state(self):
         print(f"State of {str(self)}:")
         print(f"cards: {', '.join(str(card) for card in self.state.secure_cards)}")
@@ -93,39 +124,103 @@ class Agent:
         print(self.state)
 
 
+def _play_one_round(test_game: MarjaPussi, agents: dict[str, Agent]) -> tuple[int, bool] | None:
+    """
+    Plays the freshly dealt test_game with the agents.
+    Returns the index of the playing party and if they won, None if no one played.
+    """
+    while test_game.phase != "DONE":
+        current_player, legal = test_game.player_at_turn.name, test_game.legal_actions()
+        chosen_action = agents[current_player].next_action(legal)
+        test_game.act_action(chosen_action)
+        for agent in agents.values():
+            agent.observe_action(chosen_action)
+    res = test_game.end_info()
+    playing_player = res['playing_player']
+    round_players: list = res['players']
+    if not playing_player:
+        return None
+    playing_partner = round_players[(round_players.index(playing_player) + 2) % 4]
+    points_pl = res['players_points'][playing_player] + res['players_points'][playing_partner]
+    return int(playing_player) % 2, points_pl >= res['game_value']
+
+
+def _play_rounds(round_setups: list[tuple[int, list[str]]], policy_a: Policy, policy_b: Policy, log_agent=False,
+                 log_game=False, custom_rules: dict = None) -> list[tuple[int, bool] | None]:
+    """
+    Plays one game for every seed and seating of players, reusing one game and its agents for all of them.
+    Returns the outcome of every game, see _play_one_round.
+    """
+    test_game, agents = None, {}
+    outcomes = []
+    for seed, players in round_setups:
+        random.seed(seed)
+        np.random.seed(seed)
+        if test_game is None:
+            test_game = MarjaPussi(players, log=log_game, fancy=True, override_rules=custom_rules)
+            agents = {player.name: Agent(player.name, [p.name for p in test_game.players],
+                                         policy_a if int(player.name) % 2 == 0 else policy_b, player.cards,
+                                         log=log_agent, history=test_game.all_actions)
+                      for player in test_game.players}
+        else:
+            test_game.reset(players)
+            for player in test_game.players:
+                agents[player.name].reset([p.name for p in test_game.players], player.cards,
+                                          history=test_game.all_actions)
+        outcomes.append(_play_one_round(test_game, agents))
+    return outcomes
+
+
 def test_agents(policy_a: Policy, policy_b: Policy, log_agent=False, log_game=False,
-                rounds: int = 100, custom_rules: dict = None) -> tuple[tuple[int, ...], tuple[int, ...]]:
+                rounds: int = 100, custom_rules: dict = None, processes: int = 1,
+                seed: int = None) -> tuple[tuple[int, ...], tuple[int, ...]]:
     """
     Plays specified number of rounds and returns wins and losses of policy_A and policy_B.
+    Every round gets its own seed, drawn from seed or else from the global random module.
+    With processes > 1 the rounds are played in parallel and every batch of rounds gets its own copy of the policies,
+    so only use it for policies that don't keep state between games.
     """
     print(f"Testing {type(policy_a).__name__} vs {type(policy_b).__name__} in {rounds} games.")
-    players = ['10', '11', '12', '13']  # 0,2 play with policy_A and 1,3 with policy_B
+    players = deque(['10', '11', '12', '13'])  # 0,2 play with policy_A and 1,3 with policy_B
     results = [[0, 0], [0, 0]]
     if not custom_rules:
         custom_rules = {}
+    processes = max(1, min(processes, rounds))
 
-    for _ in trange(rounds, leave=False):
-        test_game = MarjaPussi(players, log=log_game, fancy=True, override_rules=custom_rules)
-        agents = {player.name: Agent(player.name, [p.name for p in test_game.players],
-                                     policy_a if int(player.name) % 2 == 0 else policy_b, player.cards, log=log_agent)
-                  for player in test_game.players}
-
-        while test_game.phase != "DONE":
-            current_player, legal = test_game.player_at_turn.name, test_game.legal_actions()
-            chosen_action = agents[current_player].next_action(legal)
-            test_game.act_action(chosen_action)
-            for agent in agents.values():
-                agent.observe_action(chosen_action)
-        res = test_game.end_info()
-        playing_player = res['playing_player']
-        players: list = res['players']
-        if playing_player:
-            playing_partner = players[(players.index(playing_player) + 2) % 4]
-            points_pl = res['players_points'][playing_player] + res['players_points'][playing_partner]
-            won = points_pl >= res['game_value']
-            results[int(playing_player) % 2][0 if won else 1] += 1
+    seed_rng = random.Random(seed) if seed is not None else random
+    round_setups = []
+    for _ in range(rounds):
+        round_setups.append((seed_rng.randrange(2 ** 32), list(players)))
         # reorder players for next round
-        players = players[1:] + [players[0]]
+        players.rotate(-1)
+
+    # every batch of rounds is played on a single game instance
+    batch_size = max(1, rounds // (4 * processes))
+    batches = [round_setups[i:i + batch_size] for i in range(0, rounds, batch_size)]
+    play_rounds = partial(_play_rounds, policy_a=policy_a, policy_b=policy_b, log_agent=log_agent,
+                          log_game=log_game, custom_rules=custom_rules)
+    outcomes = []
+    with tqdm(total=rounds, leave=False) as progress:
+        if processes > 1:
+            with Pool(processes) as pool:
+                for batch_outcomes in pool.imap_unordered(play_rounds, batches):
+                    outcomes += batch_outcomes
+                    progress.update(len(batch_outcomes))
+        else:
+            # rounds reseed random and numpy, the callers generators are restored afterwards
+            random_state, np_random_state = random.getstate(), np.random.get_state()
+            try:
+                for batch in batches:
+                    outcomes += play_rounds(batch)
+                    progress.update(len(batch))
+            finally:
+                random.setstate(random_state)
+                np.random.set_state(np_random_state)
+
+    for outcome in outcomes:
+        if outcome:
+            party, won = outcome
+            results[party][0 if won else 1] += 1
 
     party_a_played, party_a_won = sum(results[0]), results[0][0]
     party_b_played, party_b_won = sum(results[1]), results[1][0]
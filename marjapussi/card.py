@@ -1,7 +1,9 @@
 from enum import Enum
+from functools import total_ordering
 from marjapussi.gamerules import CardPoints
 
 
+@total_ordering
 class Color(Enum):
     """Card Colors"""
     Rot = "r"
@@ -13,9 +15,8 @@ class Color(Enum):
         return self.value
 
     def __lt__(self, other):
-        # Custom less-than comparison logic
-        order = ["g", "e", "s", "r"]
-        return order.index(self.value) < order.index(other.value)
+        # order: g < e < s < r
+        return COLOR_IDS[self] < COLOR_IDS[other]
 
     def fancy_name(self) -> str:
         match self.value:
@@ -29,6 +30,7 @@ class Color(Enum):
         return CardPoints[self.name].value
 
 
+@total_ordering
 class Value(Enum):
     """Card Values"""
     Ass = "A"
@@ -45,20 +47,60 @@ class Value(Enum):
         return self.value
 
     def __lt__(self, other):
-        # Custom less-than comparison logic
-        order = ["6", "7", "8", "9", "U", "O", "K", "Z", "A"]
-        return order.index(self.value) < order.index(other.value)
+        # order: 6 < 7 < 8 < 9 < U < O < K < Z < A
+        return VALUE_IDS[self] < VALUE_IDS[other]
 
     @property
     def points(self):
         return CardPoints[self.name].value
 
 
+# colors and values in ascending order, their positions make up the integer encoding of a card
+COLORS: list[Color] = [Color.Gruen, Color.Eichel, Color.Schell, Color.Rot]
+VALUES: list[Value] = [Value.Sechs, Value.Sieben, Value.Acht, Value.Neun, Value.Unter,
+                       Value.Ober, Value.Koenig, Value.Zehn, Value.Ass]
+COLOR_IDS: dict[Color, int] = {col: i for i, col in enumerate(COLORS)}
+VALUE_IDS: dict[Value, int] = {val: i for i, val in enumerate(VALUES)}
+# lookup tables from card id to color and value
+COLOR_OF: list[Color] = [COLORS[i // 9] for i in range(36)]
+VALUE_OF: list[Value] = [VALUES[i % 9] for i in range(36)]
+
+
+# the single instance of every card, by the (color, value) it was requested with
+_INTERNED: dict[tuple[Color | str, Value | str], "Card"] = {}
+
+
+@total_ordering
 class Card:
-    """A generalized Card class"""
-    def __init__(self, color: Color | str, value: Value | str):
-        self.color: Color = self._validate_and_convert(color, Color, "color")
-        self.value: Value = self._validate_and_convert(value, Value, "value")
+    """
+    A generalized Card class
+    Every card carries an id = color_idx * 9 + value_idx (0-35), ascending in the order cards are sorted,
+    so comparing and hashing cards works on plain ints
+    Cards are interned: Card(color, value) always returns the same instance, so equality is identity
+    """
+    __slots__ = ("color", "value", "_crank", "_vrank", "id")
+
+    def __new__(cls, color: Color | str, value: Value | str):
+        card = _INTERNED.get((color, value))
+        if card is not None:
+            return card
+        color_conv = cls._validate_and_convert(color, Color, "color")
+        value_conv = cls._validate_and_convert(value, Value, "value")
+        card = _INTERNED.get((color_conv, value_conv))
+        if card is None:
+            card = super().__new__(cls)
+            card.color = color_conv
+            card.value = value_conv
+            card._crank = COLOR_IDS[color_conv]
+            card._vrank = VALUE_IDS[value_conv]
+            card.id = card._crank * 9 + card._vrank
+            _INTERNED[(color_conv, value_conv)] = card
+        _INTERNED[(color, value)] = card
+        return card
+
+    def __reduce__(self):
+        # unpickled and copied cards resolve to the interned instance as well
+        return Card, (self.color, self.value)
 
     @staticmethod
     def _validate_and_convert(value, enum_class, attribute_name):
@@ -76,11 +118,15 @@ class Card:
     def __str__(self) -> str:
         return f"{self.color}-{self.value}"
 
-    def __eq__(self, other) -> bool:
-        return self.color == other.color and self.value == other.value
+    def __lt__(self, other) -> bool:
+        return self.id < other.id
 
     def __hash__(self):
-        return hash((self.color, self.value))
+        return self.id
+
+
+# every card, indexed by its id
+CARDS: list[Card] = [Card(COLOR_OF[i], VALUE_OF[i]) for i in range(36)]
 
 
 class Deck:
@@ -33,12 +33,23 @@ class MarjaPussi():
             override_rules = {}
         self.rules = MarjaPussi.DEFAULT_RULES | override_rules
         self.logger.debug(f"Ruleset: {override_rules}")
-        # init players and cards
+        # init players, their seats don't change between games
         assert len(player_names) == 4, "There have to be 4 names!"
-        deck = Deck()
-        shuffle(deck.cards)
         self.players = [Player(name, num, self.rules["points"])
                         for num, name in enumerate(player_names)]
+        for i in range(4):
+            self.players[i].set_partner(self.players[(i+2) % 4])
+            self.players[i].set_next_player(self.players[(i+1) % 4])
+        self.card_pool = Deck()
+        self.reset(player_names)
+
+    def reset(self, player_names: list[str]) -> None:
+        """Starts a new game with the given players, reusing this instance with its rules and players."""
+        assert len(player_names) == 4, "There have to be 4 names!"
+        deck = Deck()
+        shuffle(deck.cards)
+        for player, name in zip(self.players, player_names):
+            player.reset(name)
         # only used for logging
         self.players_dict = {player.number: player for player in self.players}
         while deck.cards:
@@ -49,10 +60,6 @@ class MarjaPussi():
                 f"{player.name}: {utils.cards_str(player.cards, fancy=self.fancy)}")
         self.logger.info(MarjaPussi.INFO_MSG["got_their_cards"][self.language])
 
-        for i in range(4):
-            self.players[i].set_partner(self.players[(i+2) % 4])
-            self.players[i].set_next_player(self.players[(i+1) % 4])
-
         self.original_cards = {p.name: [card for card in p.cards] for p in self.players}  # Change this line
         self.player_at_turn: Player = self.players[0]
         self.playing_player: Player | None = None
@@ -64,7 +71,16 @@ class MarjaPussi():
         self.trump: Color | None = None
         self.all_trump: list[Color] = []
         self.tricks: list[Trick] = [Trick()]
-        self.card_pool = Deck()
+
+    @property
+    def trump(self) -> Color | None:
+        return self._trump
+
+    @trump.setter
+    def trump(self, col: Color | None) -> None:
+        self._trump = col
+        # legal trick cards are checked with allowed_general specialized for the trump, until it changes
+        self._allowed_trck = utils.allowed_for_trump(col)
 
     def legal_actions(self) -> list[Action]:
         """
@@ -226,8 +242,8 @@ class MarjaPussi():
 
     def legal_trck(self) -> list[Action]:
         return [Action(self.player_at_turn.number, "TRCK", card) for card in
-                utils.allowed_general(self.player_at_turn.cards, self.tricks[-1],
-                                      first=(self.tricks[0].get_status() != 4))]
+                self._allowed_trck(self.player_at_turn.cards, self.tricks[-1],
+                                   first=(self.tricks[0].get_status() != 4))]
 
     def act_trck(self, card: Card) -> None:
         self.logger.info(
@@ -262,6 +278,7 @@ class MarjaPussi():
     def legal_ques(self) -> list[Action]:
         """ou->ours,yo->yours,my->my"""
         lvl = self.player_at_turn.asking
+        hand = utils.cards_mask(self.player_at_turn.cards)
         quests = []
         if lvl <= 2:
             quests += [Action(self.player_at_turn.number, "QUES", Talk("our", col)) for col in Color]
@@ -269,7 +286,7 @@ class MarjaPussi():
             quests += [Action(self.player_at_turn.number, "QUES", Talk("yours", None))]
         if lvl == 0:
             quests += [Action(self.player_at_turn.number, "QUES", Talk("my", col)) for col in Color
-                   if (utils.contains_col_pair(self.player_at_turn.cards, col) and col not in self.all_trump)]
+                   if (utils.contains_col_pair(hand, col) and col not in self.all_trump)]
         return quests + self.legal_trck()
 
     def act_ques(self, ques: Talk) -> None:
@@ -302,8 +319,9 @@ class MarjaPussi():
     def legal_answer(self) -> list[Action]:
         quest = self.all_actions[-1].content
         if quest.pronoun == "yours":
+            hand = utils.cards_mask(self.player_at_turn.cards)
             answ = [Action(self.player_at_turn.number, "ANSW", Talk("my", col)) for col in Color
-                    if (utils.contains_col_pair(self.player_at_turn.cards, col) and col not in self.all_trump)]
+                    if (utils.contains_col_pair(hand, col) and col not in self.all_trump)]
             if not answ:
                 return [Action(self.player_at_turn.number, "ANSW", Talk("nmy", None))]
             return answ
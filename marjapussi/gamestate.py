@@ -2,16 +2,30 @@ from marjapussi.card import Card, Deck, Color, Value
 from marjapussi.gamerules import GameRules
 from marjapussi.trick import Trick
 from marjapussi.action import Talk, Action
-from marjapussi.utils import higher_cards, all_color_cards, all_value_cards, standing_in_suite, \
+from marjapussi.utils import higher_cards, all_color_cards, all_value_cards, standing_in_suite, standing_cards, \
     calculate_set_in_3set_probability
 from marjapussi.concept import Concept, ConceptStore
 
 
 class GameState:
-    def __init__(self, name: str, all_players: list[str], start_cards: list[Card]):
+    __slots__ = ("name", "player_num", "game_rules", "provoking_history", "game_value", "current_trick",
+                 "playing_party", "all_tricks", "concepts", "points", "possible_cards",
+                 "possible_cards_probabilities", "secure_cards", "playing_player", "asking_status", "all_players",
+                 "actions", "phase", "cards_left", "player_cards_left")
+
+    def __init__(self, name: str, all_players: list[str], start_cards: list[Card], actions: list[Action] = None):
+        """
+        actions: history of all actions, shared with the game if given (e.g. MarjaPussi.all_actions).
+        While a policy observes an action, it is already the last entry of the history.
+        """
         self.name = name
-        self.player_num = all_players.index(name)  # the player with index 0 is always first
         self.game_rules = GameRules()
+        self.reset(all_players, start_cards, actions)
+
+    def reset(self, all_players: list[str], start_cards: list[Card], actions: list[Action] = None) -> None:
+        """Resets the state to the start of a new game with the given players and own start cards."""
+        name = self.name
+        self.player_num = all_players.index(name)  # the player with index 0 is always first
         self.provoking_history: list[Action] = []
         self.game_value = 115  # TODO use value from game rules
         self.current_trick = Trick()
@@ -27,7 +41,7 @@ class GameState:
         self.playing_player = ''
         self.asking_status = {player: 0 for player in all_players}
         self.all_players = all_players
-        self.actions: list[Action] = []
+        self.actions: list[Action] = actions if actions is not None else []
         self.phase = 'PROV'
         self.cards_left = set(Deck().cards)
         self.player_cards_left: list[int] = [int(len(self.cards_left) / len(self.all_players)) for i in
@@ -102,7 +116,7 @@ class GameState:
             case "yours":
                 self.asking_status[player_name] = 1
 
-    def remove_possibles(self, player_name, diff_list: list[Card] | set[Card]) -> None:
+    def remove_possibles(self, player_name, diff_list: list[Card] | tuple[Card, ...] | set[Card]) -> None:
         self.possible_cards[player_name] = self.possible_cards[player_name].difference(set(diff_list))
 
     def answer_question(self, answer: Talk, player_name: str):
@@ -239,23 +253,16 @@ class GameState:
 
     def standing_cards(self, player_name: str = None, trump: Color = '') -> set[Card]:
         """Returns all cards for the player_name (by default state owner) which can or could win the trick."""
-        standing_cards = set()
         if player_name is None:
             player_name = self.name
 
         potential_player_hand = self.secure_cards[player_name] | self.possible_cards[player_name]
         # If there's a trump suit, only the highest trump cards in hand are standing
         if trump:
-            trump_cards_in_hand = [card for card in potential_player_hand if card.suit == trump]
             return standing_in_suite(self.cards_left, trump, potential_player_hand)
 
         # If no trump, check each suit in hand
-        for suit in set(card.suit for card in potential_player_hand):
-            # Only consider cards in hand of this suit
-            suit_hand_cards = set([card for card in potential_player_hand if card.color == suit])
-            standing_cards |= standing_in_suite(self.cards_left, suit, suit_hand_cards)
-
-        return standing_cards
+        return standing_cards(self.cards_left, potential_player_hand)
 
     def partner(self, player_name: str = None) -> str:
         """Returns the partners name for a given player. Without input returns the partner of the gamestate owner"""
@@ -12,6 +12,11 @@ class Player():
         self.points = points #defined by rules of the game
         self.partner: Player = None
         self.next_player: Player = None
+        self.reset(name)
+
+    def reset(self, name: str) -> None:
+        """Prepares the player for a new game, keeping its seat."""
+        self.name = name
         self.asking = 0  # 0 -> my; 1 -> yours; 2 -> ours
         self.cards = []  # players card
         self.still_prov = True
@@ -13,7 +13,7 @@ class Policy(object):
     def observe_action(self, state: GameState, action: Action) -> None:
         """
         This method is called when the agent observes an action taken by any player.
-        The agent shall update their knowledge about the game.
+        The agent shall update their knowledge about the game. The action is already the last one in state.actions.
         """
         pass
 
@@ -409,8 +409,9 @@ class ProbabilisticPolicy(Policy):
 
         # Let's calculate which pairs we or the opponents might have
         pair_value = 0
+        hand_mask = utils.cards_mask(hand_cards)
         for color in Color:
-            if utils.contains_col_pair(list(hand_cards), color):
+            if utils.contains_col_pair(hand_mask, color):
                 state.concepts.add(Concept(f"{state.name}_has_{str(color)}_pair",
                                            {"player": state.name, "source": "assessment", "color": color},
                                            value=1.))
@@ -435,7 +436,7 @@ class ProbabilisticPolicy(Policy):
                 pair_value += color.points
                 opp_estimate_max -= color.points
 
-            elif utils.contains_col_half(list(hand_cards), color):
+            elif utils.contains_col_half(hand_mask, color):
                 # add some arbitrary amount for the colors for evaluation
                 hand_score += color.points / 5
                 opp_estimate_max -= color.points
@@ -766,7 +767,7 @@ class ProbabilisticPolicy(Policy):
         """
         total = 0
         hand_without_passed = [card for card in state.hand_cards if not card in passed_cards]
-        hand_wop_sorted = [[card for card in hand_without_passed if card.color == color] for color in Color]
+        hand_wop_sorted = list(utils.cards_by_color(hand_without_passed).values())
         color_amounts = [len(cards) for cards in hand_wop_sorted]
 
         # check being blank in two colors
@@ -783,7 +784,7 @@ class ProbabilisticPolicy(Policy):
             total += 8
 
         # check ambiguities
-        passed_sorted = [[card for card in passed_cards if card.color == color] for color in Color]
+        passed_sorted = list(utils.cards_by_color(passed_cards).values())
         for i, amount in enumerate(color_amounts):
             # having cards but still passing a low card of that color
             if amount > 0 and utils.contains_low_card(set(passed_sorted[i])):
@@ -801,30 +802,32 @@ class ProbabilisticPolicy(Policy):
 
         # keep pairs that are communicated, pass pairs that aren't, depending on value
         # TODO care for case, when two small or two big pairs were communicated
+        hand_mask, passed_mask = utils.cards_mask(state.hand_cards), utils.cards_mask(passed_cards)
+        hand_wop_mask = hand_mask & ~passed_mask
         if ProvokingInfos.SmallPair in self.communicated:
-            if utils.contains_col_pair(list(hand_without_passed), Color.Gruen) and len(hand_wop_sorted[1]) == 0:
+            if utils.contains_col_pair(hand_wop_mask, Color.Gruen) and len(hand_wop_sorted[1]) == 0:
                 total += 2
-            if utils.contains_col_pair(list(hand_without_passed), Color.Eichel) and len(hand_wop_sorted[0]) == 0:
+            if utils.contains_col_pair(hand_wop_mask, Color.Eichel) and len(hand_wop_sorted[0]) == 0:
                 total += 2
         else:
-            if (utils.contains_col_pair(list(state.hand_cards), Color.Gruen) and
-                    not utils.contains_col_pair(list(passed_cards), Color.Gruen)):
+            if (utils.contains_col_pair(hand_mask, Color.Gruen) and
+                    not utils.contains_col_pair(passed_mask, Color.Gruen)):
                 total -= 1
-            if (utils.contains_col_pair(list(state.hand_cards), Color.Eichel) and
-                    not utils.contains_col_pair(list(passed_cards), Color.Eichel)):
+            if (utils.contains_col_pair(hand_mask, Color.Eichel) and
+                    not utils.contains_col_pair(passed_mask, Color.Eichel)):
                 total -= 2
 
         if ProvokingInfos.BigPair in self.communicated:
-            if utils.contains_col_pair(list(hand_without_passed), Color.Schell) and len(hand_wop_sorted[3]) == 0:
+            if utils.contains_col_pair(hand_wop_mask, Color.Schell) and len(hand_wop_sorted[3]) == 0:
                 total += 2
-            if utils.contains_col_pair(list(hand_without_passed), Color.Rot) and len(hand_wop_sorted[2]) == 0:
+            if utils.contains_col_pair(hand_wop_mask, Color.Rot) and len(hand_wop_sorted[2]) == 0:
                 total += 2
         else:
-            if (utils.contains_col_pair(list(state.hand_cards), Color.Schell) and
-                    not utils.contains_col_pair(list(passed_cards), Color.Schell)):
+            if (utils.contains_col_pair(hand_mask, Color.Schell) and
+                    not utils.contains_col_pair(passed_mask, Color.Schell)):
                 total -= 3
-            if (utils.contains_col_pair(list(state.hand_cards), Color.Rot) and
-                    not utils.contains_col_pair(list(passed_cards), Color.Rot)):
+            if (utils.contains_col_pair(hand_mask, Color.Rot) and
+                    not utils.contains_col_pair(passed_mask, Color.Rot)):
                 total -= 4
 
         # we would like to plan ourselves if possible, if we have 5 or more halves!
@@ -1,4 +1,8 @@
 from marjapussi.card import Card, Color
+from operator import attrgetter
+
+# key for comparing cards of the same color
+_BY_RANK = attrgetter("_vrank")
 
 
 class Trick:
@@ -47,9 +51,11 @@ class Trick:
             return None
         trump_cards = [card for card in self.cards if card.color == self.trump_color]
         if trump_cards:
-            return max(trump_cards, key=lambda card: card.value)
+            return max(trump_cards, key=_BY_RANK)
         else:
-            return max(self.cards, key=lambda card: (card.color == self.base_color, card.value))
+            # the first card decides the base color, self.base_color is only set after it is played
+            base_color = self.cards[0].color
+            return max([card for card in self.cards if card.color == base_color], key=_BY_RANK)
 
     def _high_card_idx(self) -> int:
         high_card = self.high_card
@@ -1,4 +1,92 @@
-# Unittests for the game
-from marjapussi.game import MarjaPussi
+# Unittests for the game, run with: python -m unittest marjapussi.unittests
+import unittest
 
-game = MarjaPussi()
\ No newline at end of file
+from marjapussi.card import Card, Color
+from marjapussi.trick import Trick
+from marjapussi import utils
+
+
+def cards(*names: str) -> list[Card]:
+    """cards('rA', 'g6') -> [Card(Rot, Ass), Card(Gruen, Sechs)]"""
+    return [Card(name[0], name[1]) for name in names]
+
+
+def trick(trump: Color | None, *names: str) -> Trick:
+    t = Trick(trump)
+    for num, card in enumerate(cards(*names)):
+        t.play_card(card, num)
+    return t
+
+
+class TestStandingCards(unittest.TestCase):
+
+    def test_without_majority_only_the_top_cards_without_gaps_stand(self):
+        left = set(cards('rA', 'rZ', 'rK', 'rO', 'rU', 'r9', 'r8'))
+        self.assertEqual(utils.standing_in_suite(left, Color.Rot, set(cards('rA', 'rZ', 'rO'))),
+                         set(cards('rA', 'rZ')))
+        left.add(Card('r', '7'))
+        self.assertEqual(utils.standing_in_suite(left, Color.Rot, set(cards('rA', 'rK'))), set(cards('rA')))
+
+    def test_with_majority_gaps_are_allowed(self):
+        left = set(cards('rA', 'rZ', 'rK', 'rO', 'rU', 'r9', 'r8', 'r7'))
+        hand = set(cards('rA', 'rK', 'rO', 'r9'))
+        self.assertEqual(utils.standing_in_suite(left, Color.Rot, hand), hand)
+
+    def test_standing_cards_of_all_colors(self):
+        left = set(cards('rA', 'rZ', 'rK', 'rO', 'gA', 'gZ'))
+        possible = set(cards('rA', 'rK', 'gZ'))
+        self.assertEqual(utils.standing_cards(left, possible), set(cards('rA', 'rK')))
+
+
+class TestHigherCards(unittest.TestCase):
+
+    def test_no_trump_only_base_color_is_higher(self):
+        t = trick(None, 'gO', 'sA')
+        self.assertEqual(utils.higher_cards(t, cards('g6', 'gK', 'sZ', 'gA')), cards('gK', 'gA'))
+
+    def test_trick_taken_over_by_trump(self):
+        t = trick(Color.Rot, 'gO', 'r9')
+        self.assertEqual(utils.higher_cards(t, cards('gA', 'r8', 'rU', 'rA')), cards('rU', 'rA'))
+
+    def test_all_trumps_beat_base_color(self):
+        self.assertEqual(utils.higher_cards(trick(Color.Rot, 'gO')),
+                         cards('gK', 'gZ', 'gA', 'r6', 'r7', 'r8', 'r9', 'rU', 'rO', 'rK', 'rZ', 'rA'))
+        self.assertEqual(utils.higher_cards(trick(Color.Rot, 'rK')), cards('rZ', 'rA'))
+
+
+class TestAllowedCards(unittest.TestCase):
+
+    def test_first_card_of_the_game_is_ace_green_or_any(self):
+        self.assertEqual(utils.allowed_general(cards('g6', 'sA', 'rK'), Trick(), True), cards('sA'))
+        self.assertEqual(utils.allowed_general(cards('e7', 'g6', 'gZ'), Trick(), True), cards('g6', 'gZ'))
+        self.assertEqual(utils.allowed_general(cards('e7', 'rK'), Trick(), True), cards('e7', 'rK'))
+
+    def test_first_trick_has_to_be_won_with_the_ace(self):
+        self.assertEqual(utils.allowed_general(cards('gK', 'gA', 'rA'), trick(None, 'gO'), True), cards('gA'))
+
+    def test_base_color_has_to_be_followed_and_beaten_if_possible(self):
+        self.assertEqual(utils.allowed_general(cards('g6', 'gK', 'rA'), trick(None, 'gO')), cards('gK'))
+        self.assertEqual(utils.allowed_general(cards('g6', 'g9', 'rA'), trick(None, 'gO')), cards('g6', 'g9'))
+
+    def test_trump_has_to_be_played_without_base_color(self):
+        self.assertEqual(utils.allowed_general(cards('eA', 'r7', 'rK'), trick(Color.Rot, 'gO')), cards('r7', 'rK'))
+
+    def test_trump_has_to_be_beaten_if_possible(self):
+        t = trick(Color.Rot, 'gO', 'rZ')
+        self.assertEqual(utils.allowed_general(cards('eA', 'r7', 'rA'), t), cards('rA'))
+        self.assertEqual(utils.allowed_general(cards('eA', 'r7'), t), cards('r7'))
+
+
+class TestTrick(unittest.TestCase):
+
+    def test_lowest_trump_takes_the_trick(self):
+        t = trick(Color.Rot, 'gO', 'gA', 'r6', 'sA')
+        self.assertIs(t.high_card, Card('r', '6'))
+        self.assertEqual(t.high_card_idx, 2)
+
+    def test_no_trump_highest_base_color_takes_the_trick(self):
+        self.assertIs(trick(None, 'gO', 'sA', 'gK').high_card, Card('g', 'K'))
+
+
+if __name__ == '__main__':
+    unittest.main()
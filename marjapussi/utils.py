@@ -1,11 +1,51 @@
-from marjapussi.card import Card, Deck, Color, Value
+from marjapussi.card import Card, Deck, Color, Value, CARDS, COLORS, COLOR_IDS
 from marjapussi.trick import Trick
+from functools import lru_cache
 from itertools import combinations
+from operator import attrgetter
+from typing import Callable
 import math
 
+# key for sorting cards, C-level instead of going through Card.__lt__
+_BY_ID = attrgetter("id")
+
 text_format = {"r": "\033[91m", "s": "\033[93m", "e": "\033[96m", "g": "\033[92m",
                "end": "\033[0m", "bold": "\033[1m", "uline": "\033[4m"}
 
+# card sets as bitmasks: bit card.id is set if the card is in the set, every color occupies 9 consecutive bits
+SUIT_BITS = (1 << 9) - 1
+
+
+def cards_mask(cards: list[Card] | set[Card]) -> int:
+    """Returns the bitmask of the given cards."""
+    mask = 0
+    for card in cards:
+        mask |= 1 << card.id
+    return mask
+
+
+def mask_cards(mask: int) -> list[Card]:
+    """Returns the cards of the given bitmask in ascending order."""
+    cards = []
+    while mask:
+        low = mask & -mask
+        cards.append(CARDS[low.bit_length() - 1])
+        mask ^= low
+    return cards
+
+
+# index of the trump color in HIGHER_MASK, 0 if there is no trump
+TRUMP_IDS: dict[Color | None, int] = {None: 0} | {col: COLOR_IDS[col] + 1 for col in Color}
+# HIGHER_MASK[high_card.id][TRUMP_IDS[trump]] is the mask of all cards winning against the high card of a trick:
+# higher cards of the same color, or trump if the high card isn't trump itself
+HIGHER_MASK: list[list[int]] = [
+    [cards_mask(c for c in CARDS if (c.id > high.id if c.color == high.color else c.color == trump))
+     for trump in [None] + COLORS]
+    for high in CARDS]
+
+# mask of the pair (Koenig and Ober) of each color
+PAIR_MASK: dict[Color, int] = {col: cards_mask([Card(col, Value.Koenig), Card(col, Value.Ober)]) for col in Color}
+
 
 def allowed_first(cards: list[Card]) -> list[Card]:
     """Filters cards by allowed first: First player has to play an ace, green or any card."""
@@ -19,57 +59,79 @@ def allowed_first(cards: list[Card]) -> list[Card]:
 
 def allowed_general(hand: list[Card], trick: Trick, first=False) -> list[Card]:
     """Sorts which cards are allowed to be played from the hand right now"""
-    if trick.get_status() == 0 and first:
-        return allowed_first(hand)
-    if trick.get_status() == 0:
-        return hand
+    return _ALLOWED_FOR_TRUMP[trick.trump_color](hand, trick, first)
+
+
+def allowed_for_trump(trump: Color | None) -> Callable[[list[Card], Trick, bool], list[Card]]:
+    """
+    Returns allowed_general specialized for the given trump, to be used for tricks with exactly that trump.
+    The trump only changes on calls, so a caller evaluating many tricks can keep the function until then.
+    """
+    return _ALLOWED_FOR_TRUMP[trump]
+
+
+def _make_allowed(trump: Color | None) -> Callable[[list[Card], Trick, bool], list[Card]]:
+    # cards beating each high card with this trump, indexed by the high card id
+    higher_by_high_card = [higher[TRUMP_IDS[trump]] for higher in HIGHER_MASK]
+
+    def allowed_with_trump(hand: list[Card], trick: Trick, first=False) -> list[Card]:
+        if not trick.cards:
+            return allowed_first(hand) if first else hand
+
+        hand_by_color = cards_by_color(hand)
+        if first:
+            # check for ace
+            ace = next((card for card in hand_by_color[trick.base_color] if card.value == Value.Ass), None)
+            if ace:
+                return [ace]
+
+        # need to play base_color first, then trump and then any. Needs to go also higher than previous trick cards
+        allowed = hand_by_color[trick.base_color]
+        if not allowed and trump:
+            allowed = hand_by_color[trump]
+        higher = higher_by_high_card[trick.high_card.id]
+        high_cards = [card for card in allowed if higher >> card.id & 1]
+        if high_cards:
+            allowed = high_cards
+
+        return allowed if allowed else hand
 
-    if first:
-        # check for ace
-        ace = next((card for card in hand if card.color == trick.base_color and card.value == Value.Ass), None)
-        if ace:
-            return [ace]
+    return allowed_with_trump
 
-    # need to play base_color first, then trump and then any. Needs to go also higher than previous trick cards
-    allowed = [card for card in hand if card.color == trick.base_color]
-    if not allowed and trick.trump_color:
-        allowed = [card for card in hand if card.color == trick.trump_color]
-    high_cards = higher_cards(trick, allowed)
-    if high_cards:
-        allowed = high_cards
 
-    return allowed if allowed else hand
+_ALLOWED_FOR_TRUMP: dict[Color | None, Callable[[list[Card], Trick, bool], list[Card]]] = {
+    trump: _make_allowed(trump) for trump in [None] + COLORS}
 
 
-def higher_cards(trick: Trick, card_pool: list[Card] | set[Card] = None) -> list[Card]:
+def higher_cards(trick: Trick, card_pool: list[Card] | tuple[Card, ...] | set[Card] = None) -> list[Card]:
     """Returns all cards out of the pool that would win the given trick."""
     # default: Check all cards for higher cards
-    if card_pool is None:
-        card_pool = Deck().cards
     if trick.get_status():
-        # trick is trump color trick
-        if trick.trump_color == trick.base_color:
-            return [c for c in card_pool if trick.base_color == c.color and c.value > trick.high_card.value]
-        # trick has been taken over by trump, but with different base color, can only be beaten by trump
-        elif trick.trump_color == trick.high_card.color:
-            return [c for c in card_pool if (c.color == trick.trump_color and c.value > trick.high_card.value)]
-        # a true base color trick
-        else:
-            return [c for c in card_pool if (trick.base_color == c.color and c.value > trick.high_card.value)
-                    or c.color == trick.trump_color]
+        higher = higher_cards_mask(trick.high_card, trick.trump_color)
+        if card_pool is not None:
+            higher &= cards_mask(card_pool)
+        return mask_cards(higher)
     else:
-        return card_pool
+        return card_pool if card_pool is not None else Deck().cards
 
 
-def contains_col_pair(cards: list[Card], col: Color) -> bool:
-    """Checks cards for the pair of specified Color"""
-    return any(c.color == col and c.value == Value.Koenig for c in cards) and any(
-        c.color == col and c.value == Value.Ober for c in cards)
+def higher_cards_mask(high_card: Card, trump: Color | None) -> int:
+    """Returns the mask of all cards beating the high card of a trick with the given trump."""
+    return HIGHER_MASK[high_card.id][TRUMP_IDS[trump]]
 
 
-def contains_col_half(cards: list[Card], col: Color) -> bool:
-    """Checks cards for one half of pair of specified Color"""
-    return any(card.color == col and (card.value == Value.Koenig or card.value == Value.Ober) for card in cards)
+def contains_col_pair(cards: list[Card] | set[Card] | int, col: Color) -> bool:
+    """Checks cards (or their mask) for the pair of specified Color"""
+    if not isinstance(cards, int):
+        cards = cards_mask(cards)
+    return cards & PAIR_MASK[col] == PAIR_MASK[col]
+
+
+def contains_col_half(cards: list[Card] | set[Card] | int, col: Color) -> bool:
+    """Checks cards (or their mask) for one half of pair of specified Color"""
+    if not isinstance(cards, int):
+        cards = cards_mask(cards)
+    return cards & PAIR_MASK[col] != 0
 
 
 def contains_pair(cards: set[Card]) -> bool:
@@ -87,26 +149,44 @@ def contains_low_card(cards: set[Card]) -> bool:
     return any(card.value <= Value.Unter for card in cards)
 
 
+def cards_by_color(cards: list[Card] | set[Card]) -> dict[Color, list[Card]]:
+    """Groups the cards by color in a single pass, keeping their order within each color."""
+    by_color = {col: [] for col in Color}
+    for card in cards:
+        by_color[card.color].append(card)
+    return by_color
+
+
 def sorted_cards(cards: list[Card]) -> list[Card]:
-    return sorted(cards, key=lambda card: (card.color, card.value))
+    return sorted(cards, key=_BY_ID)
+
 
+_ALL_COLOR_CARDS: dict[Color, tuple[Card, ...]] = {col: tuple(Card(col, v) for v in Value) for col in Color}
+_ALL_VALUE_CARDS: dict[Value, tuple[Card, ...]] = {val: tuple(Card(c, val) for c in Color) for val in Value}
 
-def all_color_cards(col: Color) -> list[Card]:
+
+def all_color_cards(col: Color) -> tuple[Card, ...]:
     """Returns all cards with given color."""
-    return [Card(col, v) for v in Value]
+    return _ALL_COLOR_CARDS[col]
 
 
-def all_value_cards(value: Value) -> list[Card]:
+def all_value_cards(value: Value) -> tuple[Card, ...]:
     """Returns all cards with given type."""
-    return [Card(c, value) for c in Color]
+    return _ALL_VALUE_CARDS[value]
+
+
+# string of every card by its id, with and without color formatting
+PLAIN_STR: list[str] = [str(card) for card in CARDS]
+FANCY_STR: list[str] = [text_format[str(card.color)] + str(card) + text_format["end"] for card in CARDS]
 
 
 def card_str(card: Card, fancy=True) -> str:
-    return text_format[str(card.color)] + str(card) + text_format["end"] if fancy else str(card)
+    return FANCY_STR[card.id] if fancy else PLAIN_STR[card.id]
 
 
 def cards_str(cards: list[Card], fancy=True) -> str:
-    return " ".join([card_str(card, fancy=fancy) for card in cards])
+    card_strs = FANCY_STR if fancy else PLAIN_STR
+    return " ".join([card_strs[card.id] for card in cards])
 
 
 def color_str(col: Color, fancy=True) -> str:
@@ -174,37 +254,49 @@ def calculate_set_in_3set_probability(possible_sets: list[set[Card]], set_sizes:
     return set_possibilities_restrict / set_possibilities
 
 
+def _standing_in_suite_mask(left: int, in_hand: int, color: Color) -> int:
+    """
+    left: mask of all cards still in the game
+    in_hand: mask of the cards the player (possibly) has
+    returns the mask of the cards of color in_hand that are standing
+    """
+    offset = COLOR_IDS[color] * 9
+    return _standing_suite_bits(left >> offset & SUIT_BITS, in_hand >> offset & SUIT_BITS) << offset
+
+
+@lru_cache(maxsize=None)
+def _standing_suite_bits(left: int, in_hand: int) -> int:
+    """
+    Same as _standing_in_suite_mask on the 9 bits of a single color, independent of which color it is.
+    There are only 2^18 possible inputs, so results are cached.
+    """
+    # with the majority of the color the k-th highest card of the player may have up to 2k higher cards left above it,
+    # else the player needs to hold the highest cards without gaps
+    majority = in_hand.bit_count() >= left.bit_count() / 2
+    standing = 0
+    stand_nr = 0
+    while in_hand:
+        top = 1 << (in_hand.bit_length() - 1)
+        in_hand ^= top
+        higher_left = (left & ~((top << 1) - 1)).bit_count()
+        if not left & top or higher_left > (2 * stand_nr if majority else stand_nr):
+            break
+        standing |= top
+        stand_nr += 1
+    return standing
+
+
 def standing_in_suite(leftover_cards: set[Card], color: Color, possible_cards: set[Card]) -> set[Card]:
     """returns all cards of color that are standing in the possible_cards belonging to the player with player_num"""
-    # first, we need to sort the cards of the color we want to check
-    col_cards = sorted_cards([card for card in possible_cards if card.color == color])
-    col_cards.reverse()
-    all_col_cards_left = sorted_cards([card for card in leftover_cards if card.color == color])
-    all_col_cards_left.reverse()
-    majority = len(col_cards) >= len(all_col_cards_left)/2
-    standing = []
-    for card in col_cards:
-        stand_nr = len(standing)
-        if not majority:
-            if card == all_col_cards_left[stand_nr]:
-                standing.append(card)
-            else:
-                break
-        else:
-            no_higher_zone = all_col_cards_left[stand_nr:(2*stand_nr+1)]
-            if card in no_higher_zone:
-                standing.append(card)
-            else:
-                break
-
-    return set(standing)
+    return set(mask_cards(_standing_in_suite_mask(cards_mask(leftover_cards), cards_mask(possible_cards), color)))
 
 
 def standing_cards(leftover_cards: set[Card], possible_cards: set[Card]) -> set[Card]:
-    standing = set()
+    left, in_hand = cards_mask(leftover_cards), cards_mask(possible_cards)
+    standing = 0
     for suite in Color:
-        standing |= standing_in_suite(leftover_cards, suite, possible_cards)
-    return standing
+        standing |= _standing_in_suite_mask(left, in_hand, suite)
+    return set(mask_cards(standing))
 
 def gruen_pair() -> set[Card]:
     return {Card(Color.Gruen, Value.Koenig), Card(Color.Gruen, Value.Ober)}
@@ -277,4 +369,4 @@ def smallest_x(cards: set[Card], x: int) -> list[Card]:
     """
     returns the smallest x cards out of the given cards, order: g6 -> gA, e6 -> eA, s6 -> sA, r6 -> rA
     """
-    return sorted_cards(list(cards))[0:x]
+    return sorted(cards, key=_BY_ID)[:x]